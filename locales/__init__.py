@@ -0,0 +1 @@
+"""Translations for the MicroCLI interface, one module per language."""
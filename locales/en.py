@@ -0,0 +1,44 @@
+"""English interface strings."""
+
+STRINGS = {
+    "task_database_empty": "[X] Task database is empty!",
+    "all_completed": "[*] Congratulations! All tasks completed!",
+    "total_solved": "Total solved",
+    "category": "Category",
+    "enter_answer": "Your answer",
+    "quit": "q",
+    "bye": "[WAVE] Bye!",
+    "correct": "[OK] Correct!",
+    "wrong": "[X] Wrong!",
+    "correct_answer": "Correct answer",
+    "streak_days": "Streak days",
+    "total_solved_stat": "Total solved",
+    "statistics": "[CHART] Statistics",
+    "metric": "Metric",
+    "value": "Value",
+    "by_category": "[FOLDER] By category",
+    "category_label": "Category",
+    "solved_label": "Solved",
+    "recently_completed": "[CLOCK] Recently completed",
+    "category_not_found": "[X] Category '{category}' not found!",
+    "category_completed": "All tasks in category '{category}' completed!",
+    "reset_warning": "[!] Are you sure you want to reset progress?",
+    "reset_cannot_undo": "This action [bold]cannot be undone[/bold]!",
+    "enter_yes": "Enter 'yes' to confirm",
+    "reset_confirm": "yes",
+    "progress_reset": "[OK] Progress reset!",
+    "cancelled": "Cancelled.",
+    "categories_title": "[FOLDER] Categories",
+    "no_category": "No category",
+    "today_task": "Today's task",
+    "today": "today",
+    "yesterday": "yesterday",
+    "get_today_task": "Get today's task",
+    "show_statistics": "Show statistics",
+    "choose_category": "Choose category",
+    "category_name": "Category name",
+    "show_all_categories": "Show all categories",
+    "reset_progress": "Reset progress",
+    "subtitle_enter": "Press Enter to answer or 'q' to quit",
+    "subtitle_quit": "Press Enter to answer or 'q' to quit",
+}
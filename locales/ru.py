@@ -0,0 +1,44 @@
+"""Russian interface strings."""
+
+STRINGS = {
+    "task_database_empty": "[X] База заданий пуста!",
+    "all_completed": "[*] Поздравляем! Все задания выполнены!",
+    "total_solved": "Всего решено",
+    "category": "Категория",
+    "enter_answer": "Ваш ответ",
+    "quit": "й",
+    "bye": "[WAVE] До встречи!",
+    "correct": "[OK] Правильно!",
+    "wrong": "[X] Неверно!",
+    "correct_answer": "Правильный ответ",
+    "streak_days": "Дней подряд",
+    "total_solved_stat": "Всего решено",
+    "statistics": "[CHART] Статистика",
+    "metric": "Метрика",
+    "value": "Значение",
+    "by_category": "[FOLDER] По категориям",
+    "category_label": "Категория",
+    "solved_label": "Решено",
+    "recently_completed": "[CLOCK] Недавно выполненные",
+    "category_not_found": "[X] Категория '{category}' не найдена!",
+    "category_completed": "Все задания в категории '{category}' выполнены!",
+    "reset_warning": "[!] Вы уверены, что хотите сбросить прогресс?",
+    "reset_cannot_undo": "Это действие [bold]нельзя отменить[/bold]!",
+    "enter_yes": "Введите 'yes' для подтверждения",
+    "reset_confirm": "yes",
+    "progress_reset": "[OK] Прогресс сброшен!",
+    "cancelled": "Отменено.",
+    "categories_title": "[FOLDER] Категории",
+    "no_category": "Без категории",
+    "today_task": "Сегодняшнее задание",
+    "today": "сегодня",
+    "yesterday": "вчера",
+    "get_today_task": "Получить сегодняшнее задание",
+    "show_statistics": "Показать статистику",
+    "choose_category": "Выбрать категорию",
+    "category_name": "Название категории",
+    "show_all_categories": "Показать все категории",
+    "reset_progress": "Сбросить прогресс",
+    "subtitle_enter": "Нажмите Enter для ответа или 'q' для выхода",
+    "subtitle_quit": "Нажмите Enter для ответа или 'q' для выхода",
+}
@@ -4,361 +4,331 @@ MicroCLI - Micro-learning system via CLI
 Supports Russian and English languages.
 """
 import argparse
-import json
-import os
 import sys
-from datetime import datetime
-from pathlib import Path
-
-from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.theme import Theme
+from types import MappingProxyType
 
 # Localization support
-LOCALE_DIR = Path(__file__).parent / "locales"
 _translations = {}
 
 
+class _Locale(dict):
+    """Translation table that returns the key itself for missing strings."""
+
+    def __missing__(self, key: str) -> str:
+        return key
+
+
 def load_locale(lang: str = "ru") -> dict:
-    """Load translation file."""
-    locale_file = LOCALE_DIR / f"{lang}.json"
-    if locale_file.exists():
-        with open(locale_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    """Load translation module ``locales.<lang>``."""
+    import importlib
+    try:
+        return importlib.import_module(f"locales.{lang}").STRINGS
+    except ModuleNotFoundError:
+        return {}
+
+
+def get_locale(lang: str = "ru") -> dict:
+    """Get the translation table for a language, loading it on first use."""
+    locale = _translations.get(lang)
+    if locale is None:
+        locale = _translations[lang] = _Locale(load_locale(lang))
+    return locale
 
 
 def _(key: str, lang: str = "ru") -> str:
     """Get translated string."""
-    global _translations
-    if lang not in _translations:
-        _translations[lang] = load_locale(lang)
-    return _translations[lang].get(key, key)
+    return get_locale(lang)[key]
 
 
-def set_language(lang: str):
-    """Set current language."""
-    global _translations
-    _translations[lang] = load_locale(lang)
-
+# Panel title color per category
+_CATEGORY_COLORS = MappingProxyType({
+    "Логика": "cyan",
+    "Математика": "magenta",
+    "Программирование": "green",
+    "Языки": "yellow",
+    "Общие знания": "blue",
+})
 
-# Custom theme
-theme = Theme({
-    "success": "green",
-    "error": "red",
-    "info": "blue",
-    "warning": "yellow",
+# Category counters written by 'reset'
+_DEFAULT_CATEGORY_STATS = MappingProxyType({
+    "Логика": 0,
+    "Математика": 0,
+    "Программирование": 0,
+    "Языки": 0,
+    "Общие знания": 0
 })
 
-console = Console(theme=theme)
+# Rich is imported on first use so that --help and argument errors stay fast
+_console = None
+
+
+def _get_console():
+    """Create the themed console on first call and cache it."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        from rich.theme import Theme
+
+        # Custom theme
+        theme = Theme({
+            "success": "green",
+            "error": "red",
+            "info": "blue",
+            "warning": "yellow",
+        })
+        _console = Console(theme=theme)
+    return _console
 
 
 def get_tasks() -> list:
     """Load tasks from JSON file."""
-    tasks_file = Path(__file__).parent / "tasks.json"
-    if tasks_file.exists():
-        with open(tasks_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
+    from pathlib import Path
+    from utils import load_tasks
+    return load_tasks(Path(__file__).parent / "tasks.json")
 
 
-def get_progress() -> dict:
+def get_progress():
     """Load progress from JSON file."""
-    progress_file = Path(__file__).parent / "progress.json"
-    if progress_file.exists():
-        with open(progress_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {
-        "total_solved": 0,
-        "streak_days": 0,
-        "last_solved_date": None,
-        "completed_tasks": {},
-        "category_stats": {}
-    }
+    from pathlib import Path
+    from utils import load_progress
+    return load_progress(Path(__file__).parent / "progress.json")
 
 
-def save_progress(progress: dict):
+def save_progress(progress):
     """Save progress to JSON file."""
-    progress_file = Path(__file__).parent / "progress.json"
-    with open(progress_file, 'w', encoding='utf-8') as f:
-        json.dump(progress, f, ensure_ascii=False, indent=2)
-
+    from pathlib import Path
+    from utils import save_progress as save_progress_file
+    save_progress_file(progress, Path(__file__).parent / "progress.json")
 
-def get_today() -> str:
-    """Get today's date as string."""
-    return datetime.now().strftime('%Y-%m-%d')
 
+# Styled verdict lines per language, built once instead of parsing markup per answer
+_RESULT_MESSAGES = {}
 
-def normalize_answer(answer: str) -> str:
-    """Normalize answer for comparison."""
-    return answer.strip().lower()
 
+def _result_messages(lang: str) -> dict:
+    """Get the prebuilt "correct"/"wrong" ``Text`` lines for a language."""
+    messages = _RESULT_MESSAGES.get(lang)
+    if messages is None:
+        from rich.text import Text
 
-def check_answer(user_answer: str, correct_answer: str, options: list = None) -> bool:
-    """Check if answer is correct."""
-    user = normalize_answer(user_answer)
-    correct = normalize_answer(correct_answer)
-    
-    if user == correct:
-        return True
-    
-    if options:
-        for opt in options:
-            if normalize_answer(opt) == correct:
-                return True
-    
-    return False
+        L = get_locale(lang)
+        messages = _RESULT_MESSAGES[lang] = {
+            "correct": Text.assemble("\n", (L["correct"], "success")),
+            "wrong": Text.assemble("\n", (L["wrong"], "error")),
+        }
+    return messages
 
 
-def get_random_task(completed_ids: list, tasks: list) -> dict:
-    """Get random uncompleted task."""
-    available = [t for t in tasks if t['id'] not in completed_ids]
-    if not available:
-        return None
-    import random
-    return random.choice(available)
+def _run_task(task: dict, progress, lang: str = "ru") -> None:
+    """Show a task, check the answer and record progress if it is correct."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
 
+    from utils import check_answer, update_progress
 
-def update_progress(progress: dict, task: dict, lang: str) -> dict:
-    """Update progress after correct answer."""
-    today = get_today()
-    last_date = progress.get('last_solved_date')
+    console = _get_console()
+    L = get_locale(lang)
+    messages = _result_messages(lang)
+    
+    # Show task
+    cat_color = _CATEGORY_COLORS.get(task['category'], "white")
+    
+    panel = Panel(
+        f"[bold]{task['question']}[/bold]\n\n{L['category']}: {task['category']}",
+        title=f"[{cat_color}][BOOK] {task['category']}[/{cat_color}]",
+        subtitle=L["subtitle_enter"],
+        expand=False,
+        padding=(1, 2),
+    )
+    console.print(panel)
     
-    # Update streak
-    if last_date != today:
-        if last_date:
-            last_dt = datetime.strptime(last_date, '%Y-%m-%d')
-            today_dt = datetime.strptime(today, '%Y-%m-%d')
-            diff = (today_dt - last_dt).days
-            if diff == 1:
-                progress['streak_days'] += 1
-            else:
-                progress['streak_days'] = 1
-        else:
-            progress['streak_days'] = 1
+    # Get answer
+    answer = console.input(f"\n{L['enter_answer']}: ")
     
-    progress['last_solved_date'] = today
-    progress['total_solved'] += 1
-    progress['completed_tasks'][task['id']] = today
+    if answer.lower() in ('q', 'й', L['quit']):
+        console.print(L["bye"])
+        return
     
-    # Update category stats
-    cat = task['category']
-    if cat not in progress.get('category_stats', {}):
-        progress['category_stats'][cat] = 0
-    progress['category_stats'][cat] += 1
+    correct = check_answer(answer, task)
     
-    return progress
+    if correct:
+        progress, changed = update_progress(progress, task)
+        if changed:
+            save_progress(progress)
+        
+        lines = [messages["correct"]]
+        if 'explanation' in task:
+            lines.append(Text("\n[BULB] ").append(task['explanation']))
+        lines.append(Text(f"\n{L['streak_days']}: {progress.streak_days}"))
+        lines.append(Text(f"{L['total_solved_stat']}: {progress.total_solved}"))
+    else:
+        lines = [messages["wrong"], Text(f"{L['correct_answer']}: {task['answer']}")]
+        if 'explanation' in task:
+            lines.append(Text("\n[BULB] ").append(task['explanation']))
+    
+    # One print call for the whole result block
+    console.print(Group(*lines))
 
 
 def cmd_today(args):
     """Show today's task."""
+    from utils import get_random_task
+
+    console = _get_console()
     lang = args.lang or "ru"
-    set_language(lang)
+    L = get_locale(lang)
     
     tasks = get_tasks()
     progress = get_progress()
     
     if not tasks:
-        rprint(_("task_database_empty", lang))
+        console.print(L["task_database_empty"])
         return
     
-    completed_ids = list(progress.get('completed_tasks', {}).keys())
-    task = get_random_task(completed_ids, tasks)
+    task = get_random_task(progress.completed_ids, tasks)
     
     if not task:
-        rprint(_("all_completed", lang))
-        rprint(f"{_('total_solved', lang)}: {progress['total_solved']}")
-        return
-    
-    # Show task
-    category_colors = {
-        "Логика": "cyan",
-        "Математика": "magenta",
-        "Программирование": "green",
-        "Языки": "yellow",
-        "Общие знания": "blue",
-    }
-    cat_color = category_colors.get(task['category'], "white")
-    
-    panel = Panel(
-        f"[bold]{task['question']}[/bold]\n\n{_('category', lang)}: {task['category']}",
-        title=f"[{cat_color}][BOOK] {task['category']}[/{cat_color}]",
-        subtitle=_("subtitle_enter", lang),
-        expand=False,
-        padding=(1, 2),
-    )
-    rprint(panel)
-    
-    # Get answer
-    answer = console.input(f"\n{_('enter_answer', lang)}: ")
-    
-    if answer.lower() in ('q', 'й', _('quit', lang)):
-        rprint(_("bye", lang))
+        console.print(L["all_completed"])
+        console.print(f"{L['total_solved']}: {progress.total_solved}")
         return
     
-    correct = check_answer(answer, task['answer'], task.get('options'))
-    
-    if correct:
-        rprint(f"\n{_('correct', lang)}")
-        
-        progress = update_progress(progress, task, lang)
-        save_progress(progress)
-        
-        if 'explanation' in task:
-            rprint(f"\n[BULB] {task['explanation']}")
-        
-        rprint(f"\n{_('streak_days', lang)}: {progress['streak_days']}")
-        rprint(f"{_('total_solved_stat', lang)}: {progress['total_solved']}")
-    else:
-        rprint(f"\n{_('wrong', lang)}")
-        rprint(f"{_('correct_answer', lang)}: {task['answer']}")
-        
-        if 'explanation' in task:
-            rprint(f"\n[BULB] {task['explanation']}")
+    _run_task(task, progress, lang)
 
 
 def cmd_stats(args):
     """Show statistics."""
+    from collections import Counter
+
+    from rich.table import Table
+
+    console = _get_console()
     lang = args.lang or "ru"
-    set_language(lang)
+    L = get_locale(lang)
     
     progress = get_progress()
     
-    table = Table(title=_("statistics", lang), show_header=True)
-    table.add_column(_("metric", lang), style="cyan")
-    table.add_column(_("value", lang), style="magenta")
+    table = Table(title=L["statistics"], show_header=True)
+    table.add_column(L["metric"], style="cyan")
+    table.add_column(L["value"], style="magenta")
     
-    table.add_row(_("total_solved_stat", lang), str(progress.get('total_solved', 0)))
-    table.add_row(_("streak_days", lang), str(progress.get('streak_days', 0)))
+    table.add_row(L["total_solved_stat"], str(progress.total_solved))
+    table.add_row(L["streak_days"], str(progress.streak_days))
     
-    rprint(table)
+    console.print(table)
     
     # Category stats
-    cat_stats = progress.get('category_stats', {})
+    cat_stats = progress.category_stats
     if cat_stats:
-        cat_table = Table(title=_("by_category", lang), show_header=True)
-        cat_table.add_column(_("category_label", lang))
-        cat_table.add_column(_("solved_label", lang))
+        cat_table = Table(title=L["by_category"], show_header=True)
+        cat_table.add_column(L["category_label"])
+        cat_table.add_column(L["solved_label"])
         
-        for cat, count in sorted(cat_stats.items(), key=lambda x: -x[1]):
+        for cat, count in Counter(cat_stats).most_common():
             cat_table.add_row(cat, str(count))
         
-        rprint(cat_table)
+        console.print(cat_table)
     
     # Recent
-    completed = progress.get('completed_tasks', {})
-    if completed:
-        rprint(f"\n{_('recently_completed', lang)}")
-        recent = list(completed.items())[-5:]
-        for task_id, date in recent:
-            rprint(f"  * {task_id} - {date}")
+    if progress.completed_tasks:
+        console.print(f"\n{L['recently_completed']}")
+        for task_id, date in progress.recent_completed(5):
+            console.print(f"  * {task_id} - {date}")
 
 
 def cmd_category(args):
     """Show task from specific category."""
+    from utils import build_task_index, get_random_task
+
+    console = _get_console()
     lang = args.lang or "ru"
-    set_language(lang)
+    L = get_locale(lang)
     
     category = args.category
     tasks = get_tasks()
     progress = get_progress()
     
-    cat_tasks = [t for t in tasks if t.get('category') == category]
+    tasks_by_category, _task_by_id = build_task_index(tasks)
+    cat_tasks = tasks_by_category.get(category)
     
     if not cat_tasks:
-        rprint(_("category_not_found", lang).format(category=category))
+        console.print(L["category_not_found"].format(category=category))
         return
     
-    completed_ids = [
-        tid for tid, date in progress.get('completed_tasks', {}).items()
-        if any(t['id'] == tid for t in cat_tasks)
-    ]
+    cat_ids = {t['id'] for t in cat_tasks}
+    completed_ids = progress.completed_ids & cat_ids
     
     task = get_random_task(completed_ids, cat_tasks)
     
     if not task:
-        rprint(_("category_completed", lang).format(category=category))
+        console.print(L["category_completed"].format(category=category))
         return
     
-    panel = Panel(
-        f"[bold]{task['question']}[/bold]\n\n{_('category', lang)}: {task['category']}",
-        title=f"[BOOK] {category}",
-        expand=False,
-    )
-    rprint(panel)
-    
-    answer = console.input(f"\n{_('enter_answer', lang)}: ")
-    
-    correct = check_answer(answer, task['answer'], task.get('options'))
-    
-    if correct:
-        rprint(f"\n{_('correct', lang)}")
-        progress = update_progress(progress, task, lang)
-        save_progress(progress)
-        if 'explanation' in task:
-            rprint(f"\n[BULB] {task['explanation']}")
-        rprint(f"\n{_('streak_days', lang)}: {progress['streak_days']}")
-    else:
-        rprint(f"\n{_('wrong', lang)}")
-        rprint(f"{_('correct_answer', lang)}: {task['answer']}")
+    _run_task(task, progress, lang)
 
 
 def cmd_reset(args):
     """Reset progress."""
+    from utils import Progress
+
+    console = _get_console()
     lang = args.lang or "ru"
-    set_language(lang)
-    
-    rprint(_("reset_warning", lang))
-    rprint(_("reset_cannot_undo", lang))
-    
-    confirm = console.input(f"\n{_('enter_yes', lang)}: ")
-    
-    if confirm.lower() == _("reset_confirm", lang):
-        default_progress = {
-            "total_solved": 0,
-            "streak_days": 0,
-            "last_solved_date": None,
-            "completed_tasks": {},
-            "category_stats": {
-                "Логика": 0,
-                "Математика": 0,
-                "Программирование": 0,
-                "Языки": 0,
-                "Общие знания": 0
-            }
-        }
+    L = get_locale(lang)
+    
+    console.print(L["reset_warning"])
+    console.print(L["reset_cannot_undo"])
+    
+    confirm = console.input(f"\n{L['enter_yes']}: ")
+    
+    if confirm.lower() == L["reset_confirm"]:
+        default_progress = Progress(category_stats=_DEFAULT_CATEGORY_STATS.copy())
         save_progress(default_progress)
-        rprint(f"\n{_('progress_reset', lang)}")
+        console.print(f"\n{L['progress_reset']}")
     else:
-        rprint(_("cancelled", lang))
+        console.print(L["cancelled"])
 
 
 def cmd_categories(args):
     """Show all categories."""
+    from rich.table import Table
+
+    from utils import build_task_index
+
+    console = _get_console()
     lang = args.lang or "ru"
-    set_language(lang)
+    L = get_locale(lang)
     
     tasks = get_tasks()
     
     if not tasks:
-        rprint(_("task_database_empty", lang))
+        console.print(L["task_database_empty"])
         return
     
-    categories = {}
-    for task in tasks:
-        cat = task.get('category', _("no_category", lang))
-        categories[cat] = categories.get(cat, 0) + 1
+    tasks_by_category, _task_by_id = build_task_index(tasks)
+    categories = {
+        cat if cat is not None else L["no_category"]: len(cat_tasks)
+        for cat, cat_tasks in tasks_by_category.items()
+    }
     
-    table = Table(title=_("categories_title", lang), show_header=True)
-    table.add_column(_("category_label", lang), style="cyan")
-    table.add_column(_("solved_label", lang), style="magenta")
+    table = Table(title=L["categories_title"], show_header=True)
+    table.add_column(L["category_label"], style="cyan")
+    table.add_column(L["solved_label"], style="magenta")
     
     for cat, count in sorted(categories.items()):
         table.add_row(cat, str(count))
     
-    rprint(table)
+    console.print(table)
+
+
+# Subcommands: (name, handler, help, positional arguments as (name, help)).
+# Help strings are plain literals so that building the parser never loads a locale.
+_COMMANDS = (
+    ("today", cmd_today, "Get today's task", ()),
+    ("stats", cmd_stats, "Show statistics", ()),
+    ("category", cmd_category, "Choose category", (("category", "Category name"),)),
+    ("categories", cmd_categories, "Show all categories", ()),
+    ("reset", cmd_reset, "Reset progress", ()),
+)
 
 
 def main():
@@ -375,47 +345,20 @@ def main():
     
     subparsers = parser.add_subparsers(dest='command', help='Commands')
     
-    # Today
-    parser_today = subparsers.add_parser('today', help=_("get_today_task", "ru"))
-    parser_today.add_argument("--lang", "-l", choices=["ru", "en"], help="Language")
-    
-    # Stats
-    parser_stats = subparsers.add_parser('stats', help=_("show_statistics", "ru"))
-    parser_stats.add_argument("--lang", "-l", choices=["ru", "en"], help="Language")
-    
-    # Category
-    parser_cat = subparsers.add_parser('category', help=_("choose_category", "ru"))
-    parser_cat.add_argument('category', help=_("category_name", "ru"))
-    parser_cat.add_argument("--lang", "-l", choices=["ru", "en"], help="Language")
-    
-    # Categories
-    parser_list = subparsers.add_parser('categories', help=_("show_all_categories", "ru"))
-    parser_list.add_argument("--lang", "-l", choices=["ru", "en"], help="Language")
-    
-    # Reset
-    parser_reset = subparsers.add_parser('reset', help=_("reset_progress", "ru"))
-    parser_reset.add_argument("--lang", "-l", choices=["ru", "en"], help="Language")
+    for name, handler, help_text, positionals in _COMMANDS:
+        sub = subparsers.add_parser(name, help=help_text)
+        for arg_name, arg_help in positionals:
+            sub.add_argument(arg_name, help=arg_help)
+        # SUPPRESS keeps the top-level --lang unless it is repeated after the command
+        sub.add_argument("--lang", "-l", choices=["ru", "en"], default=argparse.SUPPRESS, help="Language")
+        sub.set_defaults(handler=handler)
     
     args = parser.parse_args()
     
-    # Default language
-    lang = getattr(args, 'lang', None) or "ru"
-    
     if args.command is None:
-        set_language(lang)
-        cmd_today(args)
-    elif args.command == 'today':
         cmd_today(args)
-    elif args.command == 'stats':
-        cmd_stats(args)
-    elif args.command == 'category':
-        cmd_category(args)
-    elif args.command == 'categories':
-        cmd_categories(args)
-    elif args.command == 'reset':
-        cmd_reset(args)
     else:
-        parser.print_help()
+        args.handler(args)
 
 
 if __name__ == '__main__':
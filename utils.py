@@ -1,53 +1,217 @@
 """Utility functions for MicroCLI."""
+import copy
 import json
+import os
+import tempfile
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_json(filepath: str) -> Any:
+# Parsed JSON files keyed by path: (st_mtime_ns, data)
+_JSON_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+# Last indexed tasks list: (tasks, tasks_by_category, task_by_id)
+_TASK_INDEX: Optional[Tuple[List[Dict], Dict[Optional[str], List[Dict]], Dict[str, Dict]]] = None
+
+
+def load_json(filepath: str, shared: bool = False) -> Any:
     """Load data from JSON file."""
     path = Path(filepath)
-    if path.exists():
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return None
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    key = str(path)
+    cached = _JSON_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        cached = _JSON_CACHE[key] = (mtime, data)
+    # shared=True hands out the cached object itself for read-only callers
+    return cached[1] if shared else copy.deepcopy(cached[1])
 
 
 def save_json(filepath: str, data: Any) -> None:
     """Save data to JSON file."""
     path = Path(filepath)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def load_tasks() -> List[Dict]:
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    # Write a temp file and rename it over the target so readers never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file as 0600; keep the target's permissions
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    _JSON_CACHE.pop(str(path), None)
+
+
+def load_tasks(filepath: str = 'tasks.json') -> List[Dict]:
     """Load tasks from tasks.json."""
-    tasks = load_json('tasks.json')
-    return tasks if tasks else []
-
-
-def load_progress() -> Dict:
+    tasks = load_json(filepath, shared=True)
+    if not tasks:
+        return []
+    # The list is shared with the cache; normalize answers once per parse
+    for t in tasks:
+        if '_norm_answer' not in t:
+            t['_norm_answer'] = normalize_answer(t['answer'])
+    return tasks
+
+
+def build_task_index(tasks: List[Dict]) -> Tuple[Dict[Optional[str], List[Dict]], Dict[str, Dict]]:
+    """Group tasks by category and map task ids to tasks."""
+    global _TASK_INDEX
+    # load_tasks() returns the same list while tasks.json is unchanged
+    if _TASK_INDEX is not None and _TASK_INDEX[0] is tasks:
+        return _TASK_INDEX[1], _TASK_INDEX[2]
+    tasks_by_category: Dict[Optional[str], List[Dict]] = {}
+    task_by_id: Dict[str, Dict] = {}
+    for t in tasks:
+        # Tasks without a category are grouped under None
+        tasks_by_category.setdefault(t.get('category'), []).append(t)
+        task_by_id[t['id']] = t
+    _TASK_INDEX = (tasks, tasks_by_category, task_by_id)
+    return tasks_by_category, task_by_id
+
+
+@dataclass(slots=True)
+class Progress:
+    """User progress stored in progress.json."""
+    total_solved: int = 0
+    streak_days: int = 0
+    last_solved_date: Optional[str] = None
+    last_solved_ordinal: Optional[int] = None
+    # Date -> ids solved that day, in solve order
+    completed_tasks: Dict[str, List[str]] = field(default_factory=dict)
+    category_stats: Dict[str, int] = field(default_factory=dict)
+    # Flat id set derived from completed_tasks
+    completed_ids: Set[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.completed_ids = set(chain.from_iterable(self.completed_tasks.values()))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Progress':
+        """Build progress from its JSON form, copying the mutable parts."""
+        by_date: Dict[str, List[str]] = {}
+        for key, value in data.get('completed_tasks', {}).items():
+            if isinstance(value, str):
+                # Old flat {task_id: date} layout, rewritten on next save
+                by_date.setdefault(value, []).append(key)
+            else:
+                by_date[key] = list(value)
+        return cls(
+            total_solved=data.get('total_solved', 0),
+            streak_days=data.get('streak_days', 0),
+            last_solved_date=data.get('last_solved_date'),
+            last_solved_ordinal=data.get('last_solved_ordinal'),
+            completed_tasks=by_date,
+            category_stats=dict(data.get('category_stats', {})),
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert progress to its JSON form."""
+        return {
+            "total_solved": self.total_solved,
+            "streak_days": self.streak_days,
+            "last_solved_date": self.last_solved_date,
+            "last_solved_ordinal": self.last_solved_ordinal,
+            "completed_tasks": {d: list(ids) for d, ids in self.completed_tasks.items()},
+            "category_stats": dict(self.category_stats),
+        }
+
+    def add_completed(self, task_id: str, date: str) -> None:
+        """Record a task as solved on ``date``."""
+        self.completed_tasks.setdefault(date, []).append(task_id)
+        self.completed_ids.add(task_id)
+
+    def recent_completed(self, limit: int = 5) -> List[Tuple[str, str]]:
+        """Return up to ``limit`` most recently solved ``(task_id, date)`` pairs, oldest first."""
+        recent: List[Tuple[str, str]] = []
+        for date, ids in reversed(self.completed_tasks.items()):
+            for task_id in reversed(ids):
+                recent.append((task_id, date))
+                if len(recent) == limit:
+                    return recent[::-1]
+        return recent[::-1]
+
+
+def load_progress(filepath: str = 'progress.json') -> Progress:
     """Load progress from progress.json."""
-    progress = load_json('progress.json')
-    return progress if progress else {
-        "total_solved": 0,
-        "streak_days": 0,
-        "last_solved_date": None,
-        "completed_tasks": {},
-        "category_stats": {}
-    }
+    data = load_json(filepath, shared=True)
+    return Progress.from_dict(data) if data else Progress()
 
 
-def save_progress(progress: Dict) -> None:
+def save_progress(progress: Progress, filepath: str = 'progress.json') -> None:
     """Save progress to progress.json."""
-    save_json('progress.json', progress)
+    save_json(filepath, progress.to_dict())
 
 
 def get_today_date() -> str:
     """Get today's date as string YYYY-MM-DD."""
-    from datetime import datetime
-    return datetime.now().strftime('%Y-%m-%d')
+    from datetime import date
+    return date.today().isoformat()
+
+
+def update_progress(progress: Progress, task: Dict) -> Tuple[Progress, bool]:
+    """Update progress after correct answer; return (progress, changed)."""
+    from datetime import date
+    # An already counted task leaves progress untouched
+    if task['id'] in progress.completed_ids:
+        return progress, False
+
+    today_dt = date.today()
+    today = today_dt.isoformat()
+    today_ordinal = today_dt.toordinal()
+    last_date = progress.last_solved_date
+
+    # Update streak
+    if last_date != today:
+        if last_date:
+            last_ordinal = progress.last_solved_ordinal
+            if last_ordinal is None:
+                last_ordinal = date.fromisoformat(last_date).toordinal()
+            diff = today_ordinal - last_ordinal
+            if diff == 1:
+                progress.streak_days += 1
+            else:
+                progress.streak_days = 1
+        else:
+            progress.streak_days = 1
+
+    progress.last_solved_date = today
+    progress.last_solved_ordinal = today_ordinal
+    progress.total_solved += 1
+    progress.add_completed(task['id'], today)
+
+    # Update category stats
+    cat = task['category']
+    progress.category_stats[cat] = progress.category_stats.get(cat, 0) + 1
+
+    return progress, True
 
 
 def normalize_answer(answer: str) -> str:
@@ -55,30 +219,26 @@ def normalize_answer(answer: str) -> str:
     return answer.strip().lower()
 
 
-def check_answer(user_answer: str, correct_answer: str, options: Optional[List[str]] = None) -> bool:
+def check_answer(user_answer: str, task: Dict) -> bool:
     """Check if user's answer is correct."""
-    user = normalize_answer(user_answer)
-    correct = normalize_answer(correct_answer)
-    
-    # Direct match
-    if user == correct:
-        return True
-    
-    # Check options if provided
-    if options:
-        normalized_options = {normalize_answer(opt): i for i, opt in enumerate(options)}
-        if user in normalized_options:
-            correct_index = normalized_options.get(correct)
-            if correct_index is not None:
-                return True
-    
-    return False
-
-
-def get_random_task(completed_ids: List[str], tasks: List[Dict]) -> Optional[Dict]:
+    correct = task.get('_norm_answer')
+    if correct is None:
+        correct = normalize_answer(task['answer'])
+    return normalize_answer(user_answer) == correct
+
+
+def get_random_task(completed_ids: Set[str], tasks: List[Dict]) -> Optional[Dict]:
     """Get a random task that hasn't been completed yet."""
-    available = [t for t in tasks if t['id'] not in completed_ids]
-    if not available:
-        return None
     import random
-    return random.choice(available)
+    # Set-likes such as Progress.completed_ids are used as is
+    completed = completed_ids if isinstance(completed_ids, AbstractSet) else set(completed_ids)
+    # Reservoir sampling: uniform pick in one pass without a filtered list
+    chosen = None
+    seen = 0
+    for t in tasks:
+        if t['id'] in completed:
+            continue
+        seen += 1
+        if random.random() * seen < 1.0:
+            chosen = t
+    return chosen